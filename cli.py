@@ -0,0 +1,10 @@
+# cli.py - Command-line entry point: python cli.py [serve|batch|ingest|migrate|rebuild-analytics]
+#
+# LLM and PDF worker processes are spawned, and spawn re-imports the launched
+# script in every worker. Launching main.py directly therefore loads FastAPI
+# and builds both database engines once per worker; this script imports the
+# application only in the parent process.
+
+if __name__ == "__main__":
+    import main
+    main.run_cli()
@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# Point the app at a throwaway database before main.py builds its engines
+_db_dir = tempfile.mkdtemp(prefix="neural_ninjas_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ["LLM_CACHE_ENABLED"] = "0"
+os.environ["MATCHING_BACKEND"] = "bm25"
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -9,6 +9,7 @@ const RFPProcessorSystem = () => {
     const [activeRFP, setActiveRFP] = useState(null);
     const [processing, setProcessing] = useState(false);
     const [agentLogs, setAgentLogs] = useState([]);
+    const [llmOutput, setLlmOutput] = useState('');
     const [matchedProducts, setMatchedProducts] = useState([]);
     const [finalBid, setFinalBid] = useState(null);
     const [showApproval, setShowApproval] = useState(false);
@@ -30,15 +31,8 @@ const RFPProcessorSystem = () => {
     // Fetch initial data
     const fetchAllData = async () => {
         try {
-            const [rfpsRes, productsRes, analyticsRes] = await Promise.all([
-                fetch('http://localhost:8000/rfps'),
-                fetch('http://localhost:8000/products'),
-                fetch('http://localhost:8000/analytics')
-            ]);
-
-            const rfps = await rfpsRes.json();
-            const products = await productsRes.json();
-            const analytics = await analyticsRes.json();
+            const response = await fetch('http://localhost:8000/dashboard?rfp_fields=rfp_id,client,date,status,content');
+            const { rfps, products, analytics } = await response.json();
 
             setRfpList(rfps);
             setProductCatalog(products);
@@ -90,24 +84,50 @@ const RFPProcessorSystem = () => {
         setActiveRFP(rfp);
         setProcessing(true);
         setAgentLogs([]);
+        setLlmOutput('');
         setMatchedProducts([]);
         setFinalBid(null);
         setShowApproval(false);
 
         try {
-            const response = await fetch('http://localhost:8000/process-rfp', {
+            const response = await fetch('http://localhost:8000/process-rfp/stream', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ rfp_id: rfp.rfp_id || rfp.id }) // Handle both cases just in case
             });
 
-            const data = await response.json();
-
-            // Simulate streaming logs for effect
-            for (const log of data.logs) {
-                setAgentLogs(prev => [...prev, log]);
-                await new Promise(r => setTimeout(r, 100)); // 100ms delay between logs
+            if (!response.ok) throw new Error(`Failed to queue RFP (${response.status})`);
+
+            // Read Server-Sent Events as the agents work
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            let data = null;
+            while (!data) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+
+                const frames = buffer.split('\n\n');
+                buffer = frames.pop();
+                for (const frame of frames) {
+                    const event = frame.match(/^event: (.*)$/m)?.[1];
+                    const payload = frame.match(/^data: (.*)$/m)?.[1];
+                    if (!event || !payload) continue;
+
+                    const body = JSON.parse(payload);
+                    if (event === 'log') {
+                        setAgentLogs(prev => [...prev, body]);
+                    } else if (event === 'token') {
+                        setLlmOutput(prev => prev + body.text);
+                    } else if (event === 'result') {
+                        data = body;
+                    } else if (event === 'error') {
+                        throw new Error(body.detail);
+                    }
+                }
             }
+            if (!data) throw new Error('RFP processing failed');
 
             if (data.success && data.bid) {
                 setFinalBid(data.bid);
@@ -378,6 +398,9 @@ const RFPProcessorSystem = () => {
                                         </div>
                                     </div>
                                 ))}
+                                {processing && llmOutput && (
+                                    <div className="text-slate-500 whitespace-pre-wrap break-words">{llmOutput}</div>
+                                )}
                                 <div ref={logsEndRef} />
                             </div>
                         )}
@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+import main
+
+DASHBOARD = "/dashboard?rfp_fields=rfp_id,client,date,status,content"
+
+def test_dashboard_revalidates_with_etag():
+    main.init_db()
+    client = TestClient(main.app)
+
+    first = client.get(DASHBOARD)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert set(first.json()) == {"rfps", "products", "analytics"}
+    assert "content" in first.json()["rfps"][0]
+
+    # Served from the response cache, and again after the cache entry is gone
+    assert client.get(DASHBOARD, headers={"If-None-Match": etag}).status_code == 304
+    main.response_cache.invalidate({"rfps"})
+    assert client.get(DASHBOARD, headers={"If-None-Match": etag}).status_code == 304
+
+    rfp_id = next(r["rfp_id"] for r in first.json()["rfps"] if r["status"] != "rejected")
+    client.put(f"/rfps/{rfp_id}/status", json={"status": "rejected"})
+    changed = client.get(DASHBOARD, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert next(r for r in changed.json()["rfps"] if r["rfp_id"] == rfp_id)["status"] == "rejected"
+
+def test_list_endpoints_keep_etags():
+    main.init_db()
+    client = TestClient(main.app)
+    page = client.get("/products?limit=2")
+    assert page.headers["x-next-cursor"]
+    assert client.get("/products?limit=2", headers={"If-None-Match": page.headers["etag"]}).status_code == 304
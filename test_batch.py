@@ -0,0 +1,77 @@
+import main
+
+def _add_rfps(count: int) -> list:
+    db = main.SessionLocal()
+    try:
+        ids = main.new_rfp_ids(db, count)
+        db.add_all([
+            main.RFP(rfp_id, f"Batch Client {i}",
+                     "Need 10 liters of premium exterior gloss paint, weather resistant.", "2024-06-01")
+            for i, rfp_id in enumerate(ids)
+        ])
+        db.commit()
+        return ids
+    finally:
+        db.close()
+
+def test_batch_larger_than_commit_size(monkeypatch):
+    """Workers must not share the persisting session across mid-batch commits"""
+    main.init_db()
+    monkeypatch.setattr(main, "BATCH_COMMIT_SIZE", 1)
+    ids = _add_rfps(60)
+
+    report = main.process_rfp_batch(ids, backend="bm25")
+
+    failures = [r for r in report["results"] if not r["success"]]
+    assert not failures, failures[:3]
+    assert report["summary"]["succeeded"] == len(ids)
+
+    db = main.SessionLocal()
+    try:
+        statuses = {r.status for r in db.query(main.RFP).filter(main.RFP.rfp_id.in_(ids))}
+        assert statuses == {"processed"}
+        assert db.query(main.Bid).filter(main.Bid.rfp_id.in_(ids)).count() >= len(ids)
+    finally:
+        db.close()
+
+def test_batch_does_not_hold_write_lock_during_inference(monkeypatch):
+    """Writers outside the batch commit while batch items are still inferring"""
+    import itertools
+    import threading
+
+    main.init_db()
+    monkeypatch.setattr(main, "BATCH_COMMIT_SIZE", 3)
+    ids = _add_rfps(12)
+    other_id = _add_rfps(1)[0]
+    finished = 4  # items that get through; the rest stand in for slow inference
+
+    orchestrator = main.get_orchestrator()
+    process_rfp = orchestrator.process_rfp
+    calls = itertools.count()
+    release = threading.Event()
+
+    def gated_process_rfp(*args, **kwargs):
+        if next(calls) >= finished:
+            release.wait(30)
+        return process_rfp(*args, **kwargs)
+
+    as_completed = main.as_completed
+    handled = threading.Event()  # the batch thread is done with every finished item
+
+    def tracked_as_completed(futures):
+        for i, future in enumerate(as_completed(futures), 1):
+            yield future
+            if i == finished:
+                handled.set()
+
+    monkeypatch.setattr(orchestrator, "process_rfp", gated_process_rfp)
+    monkeypatch.setattr(main, "as_completed", tracked_as_completed)
+    batch = threading.Thread(target=main.process_rfp_batch, args=(ids,), kwargs={"backend": "bm25"})
+    batch.start()
+    try:
+        assert handled.wait(30)
+        # Fails with "database is locked" if the batch kept a write transaction open
+        assert main.update_rfp_status(other_id, main.RFPStatusUpdate(status="approved"))["status"] == "approved"
+    finally:
+        release.set()
+        batch.join()
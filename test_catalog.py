@@ -0,0 +1,123 @@
+import sqlite3
+
+import main
+
+def _database_path() -> str:
+    return main.engine.url.database
+
+def test_catalog_sees_stock_written_outside_the_app():
+    """A stock change made directly in the database reaches pricing after the max age"""
+    main.init_db()
+    catalog = main.get_catalog()
+    catalog.refresh()
+    sku = "PT-001"
+    original = catalog.get(sku).stock
+
+    conn = sqlite3.connect(_database_path())
+    try:
+        conn.execute("UPDATE products SET stock = 100 WHERE sku = ?", (sku,))
+        conn.commit()
+
+        catalog.max_age = 0
+        catalog.refresh()
+        assert catalog.get(sku).stock == 100
+        snapshot = catalog.snapshot()
+        assert snapshot.stock[snapshot.rows[sku]] == 100
+    finally:
+        conn.execute("UPDATE products SET stock = ? WHERE sku = ?", (original, sku))
+        conn.commit()
+        conn.close()
+        catalog.max_age = main.CATALOG_MAX_AGE_SECONDS
+        catalog.refresh()
+
+def test_snapshot_is_read_only_and_replaced_on_change():
+    main.init_db()
+    catalog = main.get_catalog()
+    catalog.refresh()
+    before = catalog.snapshot()
+    index_version = catalog.index_version
+
+    catalog.mark_changed({"PT-002"})
+    catalog.refresh()
+
+    after = catalog.snapshot()
+    assert after is not before and after.version == before.version + 1
+    assert catalog.index_version == index_version  # names/specs unchanged
+    assert not before.stock.flags.writeable
+
+def test_retry_reprices_after_failed_reservation():
+    """A reservation that fails on stale stock must not repeat on every retry"""
+    main.init_db()
+    catalog = main.get_catalog()
+    db = main.SessionLocal()
+    try:
+        rfp_id = main.new_rfp_ids(db)[0]
+        db.add(main.RFP(rfp_id, "Harbor Authority",
+                        "Need 10 liters of marine grade protective coating, saltwater resistant.", "2024-06-01"))
+        db.commit()
+    finally:
+        db.close()
+    catalog.refresh()
+    sku = "CT-001"
+    original = catalog.get(sku).stock
+
+    # Another writer drains the stock behind the catalog's back
+    conn = sqlite3.connect(_database_path())
+    try:
+        conn.execute("UPDATE products SET stock = 5 WHERE sku = ?", (sku,))
+        conn.commit()
+
+        result = main.run_rfp_processing(rfp_id, backend="bm25")
+        retries = [log for log in result["logs"] if "reserved by a concurrent bid" in log["message"]]
+        assert len(retries) == 1
+        assert catalog.get(sku).stock == 5
+        assert all(line["product"]["sku"] != sku for line in result["bids"])
+    finally:
+        conn.execute("UPDATE products SET stock = ? WHERE sku = ?", (original, sku))
+        conn.commit()
+        conn.close()
+        catalog.refresh()
+
+def test_reprocessing_reuses_own_reservation():
+    """A re-bid counts the RFP's own hold as available and replaces it"""
+    main.init_db()
+    catalog = main.get_catalog()
+    db = main.SessionLocal()
+    try:
+        rfp_id = main.new_rfp_ids(db)[0]
+        db.add(main.RFP(rfp_id, "Harbor Authority",
+                        "Need 800 liters of marine grade protective coating, saltwater resistant.", "2024-06-01"))
+        db.commit()
+    finally:
+        db.close()
+    sku = "CT-001"
+    catalog.refresh()
+    original = catalog.get(sku).stock
+
+    conn = sqlite3.connect(_database_path())
+    try:
+        conn.execute("UPDATE products SET stock = 1000 WHERE sku = ?", (sku,))
+        conn.commit()
+        catalog.mark_changed({sku})
+
+        for _ in range(2):
+            result = main.run_rfp_processing(rfp_id, backend="bm25")
+            assert result["success"], [log["message"] for log in result["logs"]][-3:]
+            assert [(line["product"]["sku"], line["quantity"]) for line in result["bids"]] == [(sku, 800)]
+            catalog.refresh()
+            assert catalog.get(sku).stock == 200
+
+        held = conn.execute("SELECT SUM(quantity) FROM stock_reservations WHERE rfp_id = ? AND status = 'held'",
+                            (rfp_id,)).fetchone()[0]
+        assert held == 800
+
+        # Rejecting after approval returns the committed stock as well
+        main.update_rfp_status(rfp_id, main.RFPStatusUpdate(status="approved"))
+        main.update_rfp_status(rfp_id, main.RFPStatusUpdate(status="rejected"))
+        assert conn.execute("SELECT stock FROM products WHERE sku = ?", (sku,)).fetchone()[0] == 1000
+    finally:
+        conn.execute("UPDATE products SET stock = ? WHERE sku = ?", (original, sku))
+        conn.commit()
+        conn.close()
+        catalog.mark_changed({sku})
+        catalog.refresh()
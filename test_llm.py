@@ -13,6 +13,15 @@ def test_rfp_processing():
         print(f"Sending request to {url}...")
         response = requests.post(url, json=payload)
         
+        if response.status_code == 202:
+            job = response.json()
+            print(f"Queued as job {job['job_id']}, waiting for result...")
+            status = job['status']
+            while status in ("queued", "running"):
+                time.sleep(1)
+                status = requests.get(f"http://localhost:8000/jobs/{job['job_id']}").json()['status']
+            response = requests.get(f"http://localhost:8000/jobs/{job['job_id']}/result")
+        
         if response.status_code == 200:
             data = response.json()
             if data['success']:
@@ -0,0 +1,30 @@
+import pytest
+
+import main
+
+def _service(monkeypatch, response: str) -> main.LLMService:
+    """An LLMService whose model always answers with `response`"""
+    service = main.LLMService(cache=main.LLMCache(enabled=False))
+    service.model = object()
+    service._loaded.set()
+    monkeypatch.setattr(service, "_generate", lambda prompt, **kwargs: response)
+    return service
+
+@pytest.mark.parametrize("response", [
+    # Token cap hit before the closing bracket
+    '[{"sku": "PT-004", "confidence": 92, "reasoning": "Exterior gloss finish for',
+    # Not JSON at all
+    'The best fit is PT-004, followed by PT-001.',
+])
+def test_match_products_recovers_skus_from_unparsable_output(monkeypatch, response):
+    main.init_db()
+    products = main.get_catalog().products
+    matches = _service(monkeypatch, response).match_products("Need exterior gloss paint", products)
+    assert [m["product"].sku for m in matches][:1] == ["PT-004"]
+
+def test_match_products_uses_parsed_json(monkeypatch):
+    main.init_db()
+    products = main.get_catalog().products
+    response = '[{"sku": "PT-001", "confidence": 88, "reasoning": "Gloss"}]'
+    matches = _service(monkeypatch, response).match_products("Need exterior gloss paint", products)
+    assert [(m["product"].sku, m["confidence"]) for m in matches] == [("PT-001", 88)]
@@ -0,0 +1,54 @@
+import pytest
+
+import main
+
+RFP_ID = "RFP-2024-001"  # 500 liters; PT-001 is the confident match, PT-004 the runner-up
+
+def _set_stock(levels: dict) -> dict:
+    """Set stock through the ORM (so the catalog sees it); returns the old levels"""
+    db = main.SessionLocal()
+    try:
+        previous = {}
+        for sku, stock in levels.items():
+            product = db.get(main.Product, sku)
+            previous[sku] = product.stock
+            product.stock = stock
+        db.commit()
+        return previous
+    finally:
+        db.close()
+
+def _drop_reservations(rfp_id: str):
+    db = main.SessionLocal()
+    try:
+        db.query(main.StockReservation).filter(main.StockReservation.rfp_id == rfp_id).delete()
+        db.commit()
+    finally:
+        db.close()
+
+@pytest.fixture
+def short_stock():
+    """Neither PT-001 nor PT-004 can cover the RFP alone; together they can"""
+    main.init_db()
+    _drop_reservations(RFP_ID)  # an earlier hold would count as available stock
+    previous = _set_stock({"PT-001": 300, "PT-004": 300})
+    yield
+    _drop_reservations(RFP_ID)
+    _set_stock(previous)
+
+def test_short_stock_never_falls_back_to_a_weak_match(short_stock):
+    """Below the confidence floor the runner-up neither splits nor substitutes"""
+    result = main.run_rfp_processing(RFP_ID, backend="bm25")
+    assert result["bids"] == [] and not result["success"]
+    confidences = [a["confidence"] for a in result["alternatives"]]
+    assert confidences == sorted(confidences, reverse=True)
+    assert [a["sku"] for a in result["alternatives"][:2]] == ["PT-001", "PT-004"]
+    assert result["alternatives"][1]["confidence"] < main.SPLIT_MIN_CONFIDENCE
+
+def test_short_stock_splits_across_confident_matches(short_stock, monkeypatch):
+    monkeypatch.setattr(main, "SPLIT_MIN_CONFIDENCE", 35)
+    result = main.run_rfp_processing(RFP_ID, backend="bm25")
+    assert result["success"]
+    assert [(line["product"]["sku"], line["quantity"]) for line in result["bids"]] == \
+        [("PT-001", 300), ("PT-004", 200)]
+    assert all(line["confidence"] >= 35 for line in result["bids"])
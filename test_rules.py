@@ -0,0 +1,39 @@
+import pytest
+
+import main
+
+FIELDS = ("quantity", "budget", "deadline")
+
+CASES = [
+    # The sample RFPs
+    ("We require 500 liters of high-gloss exterior paint suitable for coastal conditions. "
+     "Must be weather-resistant and UV protected. Delivery needed by Q3 2024.",
+     {"quantity": 500, "deadline": "Q3 2024"}),
+    ("Looking for 800 liters of marine-grade protective coating for ship hulls. "
+     "Must be saltwater-resistant and highly durable. Budget: $100,000.",
+     {"quantity": 800, "budget": "$100,000"}),
+    ("Need 1200 liters of automotive-grade high-gloss paint for production line. "
+     "Fast-dry formula essential. Delivery within 30 days.",
+     {"quantity": 1200, "deadline": "within 30 days"}),
+    ("Require 2000 liters of epoxy floor coating for warehouse facility. "
+     "Must be chemical resistant and suitable for heavy forklift traffic.",
+     {"quantity": 2000}),
+    ("Need 600 liters of fire-resistant coating for industrial building project. "
+     "Must meet fire safety regulations and high-temperature specifications.",
+     {"quantity": 600}),
+    # Unit prices are not budgets, even after backtracking into the number
+    ("Price: $45.99 per liter, 300 liters needed.", {"quantity": 300}),
+    ("Quoted at $8.50/L for 400 liters.", {"quantity": 400}),
+    ("Pay a maximum $12 per liter for 50 gallons.", {"quantity": 189}),
+    ("Maximum $2k per drum; 10 x 55-gallon drums.", {"quantity": 2082}),
+    ("Maximum $12 per liter, budget $50,000 total.", {"budget": "$50,000"}),
+    # Budgets
+    ("Budget: $250k for the season.", {"budget": "$250k"}),
+    ("Not to exceed USD 75,000.50 by 2024-09-30.", {"budget": "USD 75,000.50", "deadline": "2024-09-30"}),
+    ("Allocated €1.2 million for coatings.", {"budget": "€1.2 million"}),
+]
+
+@pytest.mark.parametrize("text, expected", CASES)
+def test_rule_extraction(text, expected):
+    data = main.RuleExtractor([]).extract(text)
+    assert {k: v for k, v in data.items() if k in FIELDS} == expected
@@ -0,0 +1,33 @@
+import json
+
+from fastapi.testclient import TestClient
+
+import main
+
+def _events(body: str) -> list:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+def test_stream_ends_with_the_result():
+    main.init_db()
+    with TestClient(main.app) as client:
+        response = client.post("/process-rfp/stream", json={"rfp_id": "RFP-2024-003", "backend": "bm25"})
+        assert response.status_code == 200
+        events = _events(response.text)
+    assert events[0][0] == "queued"
+    assert any(kind == "log" for kind, _ in events)
+    kind, result = events[-1]
+    assert kind == "result" and "logs" in result
+
+def test_stream_is_served_on_the_event_loop():
+    """An open stream must not tie up a threadpool worker"""
+    route = next(r for r in main.app.routes if getattr(r, "path", None) == "/process-rfp/stream")
+    assert main.asyncio.iscoroutinefunction(route.endpoint)
+
+def test_stream_unknown_rfp():
+    with TestClient(main.app) as client:
+        assert client.post("/process-rfp/stream", json={"rfp_id": "RFP-0000-000"}).status_code == 404
@@ -0,0 +1,41 @@
+import asyncio
+import io
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from fastapi.testclient import TestClient
+from pypdf import PdfWriter
+
+import main
+
+def _blank_pdf() -> bytes:
+    writer = PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+def _break_pdf_pool():
+    pool = main.get_pdf_pool()
+    try:
+        pool.submit(os._exit, 1).result()
+    except BrokenProcessPool:
+        pass
+    return pool
+
+def test_upload_recovers_from_a_crashed_pdf_worker():
+    """A worker crash must not fail every later upload"""
+    broken = _break_pdf_pool()
+    with TestClient(main.app) as client:
+        response = client.post("/upload-rfp", files={"file": ("blank.pdf", _blank_pdf(), "application/pdf")})
+        assert response.status_code == 200, response.text
+        assert main.get_pdf_pool() is not broken
+
+def test_pdf_that_crashes_every_worker_is_rejected_alone(monkeypatch):
+    async def crashing(pool, path, max_pages):
+        raise BrokenProcessPool("worker died")
+    monkeypatch.setattr(main, "_extract_pdf_pages", crashing)
+    with pytest.raises(main.HTTPException) as error:
+        asyncio.run(main.extract_pdf_text("unused.pdf"))
+    assert error.value.status_code == 422
@@ -0,0 +1,106 @@
+# workers.py - Process-pool entry points for CPU-heavy work (LLM inference, PDF parsing)
+#
+# Kept separate from main.py so worker processes can run these functions
+# without main.py. Spawn also re-imports the launched script in each worker,
+# so start the app with `python cli.py` (or `uvicorn main:app`); launching
+# `python main.py` makes every worker import the whole API application.
+
+import os
+
+# Model instance owned by this worker process (set by init_llm_worker)
+_model = None
+
+def llm_model_dir() -> str:
+    """Local GPT4All model directory (AppData on Windows)"""
+    return os.path.join(os.environ['LOCALAPPDATA'], 'nomic.ai', 'GPT4All')
+
+class JsonStopper:
+    """Tracks bracket depth of generated JSON to detect when the top-level value closes"""
+    
+    def __init__(self, prefix: str = ""):
+        self.text = ""
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.end = None  # index just past the closing bracket
+        self.feed(prefix)
+    
+    def feed(self, chunk: str) -> bool:
+        """Consume generated text; returns True once the JSON value is complete"""
+        for ch in chunk:
+            self.text += ch
+            if self.end is not None:
+                continue
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch in '{[':
+                self.depth += 1
+            elif ch in '}]':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.end = len(self.text)
+        return self.end is not None
+    
+    def result(self) -> str:
+        """The JSON text, without anything generated after it closed"""
+        return self.text[:self.end] if self.end is not None else self.text
+
+def run_generation(model, prompt: str, json_prefix=None, on_token=None, **kwargs) -> str:
+    """Generate with a GPT4All model, optionally forcing and early-stopping JSON.
+
+    With json_prefix (e.g. "{"), the response is primed with that opening
+    bracket and decoding stops as soon as the matching bracket is produced.
+    """
+    stopper = JsonStopper(json_prefix) if json_prefix is not None else None
+    if on_token and json_prefix:
+        on_token(json_prefix)
+    
+    def callback(token_id: int, response: str) -> bool:
+        if on_token:
+            on_token(response)
+        # Returning False stops generation
+        return not (stopper and stopper.feed(response))
+    
+    text = model.generate(prompt + (json_prefix or ""), callback=callback, **kwargs)
+    if stopper is None:
+        return text
+    # Trim whatever the final token carried past the closing bracket
+    closed = JsonStopper(json_prefix)
+    closed.feed(text)
+    return closed.result()
+
+def init_llm_worker(model_file: str, n_threads: int):
+    """Process initializer: load a private GPT4All instance for this worker"""
+    global _model
+    from gpt4all import GPT4All
+    try:
+        _model = GPT4All(model_file, model_path=llm_model_dir(), device='cpu',
+                         n_threads=n_threads, allow_download=False)
+        print(f"✓ LLM worker {os.getpid()} loaded model ({n_threads} threads)")
+    except Exception as e:
+        print(f"LLM worker {os.getpid()} failed to load model: {e}")
+        _model = None
+
+def llm_generate(prompt: str, kwargs: dict, json_prefix=None) -> str:
+    """Run one generation on this worker's model"""
+    if _model is None:
+        raise RuntimeError(f"LLM worker {os.getpid()} has no model loaded")
+    return run_generation(_model, prompt, json_prefix, **kwargs)
+
+def count_pdf_pages(path: str) -> int:
+    """Number of pages in a PDF on disk"""
+    from pypdf import PdfReader
+    return len(PdfReader(path).pages)
+
+def extract_pdf_pages(path: str, start: int, stop: int) -> list:
+    """Extract the text of pages [start, stop) of a PDF on disk"""
+    from pypdf import PdfReader
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]